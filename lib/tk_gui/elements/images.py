@@ -240,6 +240,8 @@ class ScrollableImage(SrcImageMixin, Element, base_style_layer='image'):
         kwargs.setdefault('pad', (0, 0))
         Element.__init__(self, **kwargs)
         self.init_src_image(image, use_cache=use_cache, keep_ratio=keep_ratio, resample=resample)
+        # An image that was already resized to the target size does not need to be resized again when packing
+        self._init_image = image if isinstance(image, ResizedImage) else None
 
     # def __repr__(self) -> str:
     #     size = self.size
@@ -267,7 +269,9 @@ class ScrollableImage(SrcImageMixin, Element, base_style_layer='image'):
         raise RuntimeError('Grid is not currently supported for images')
 
     def pack_into(self, row: Row):
-        resized = self._src_image.as_size(self.size, **self._resize_kwargs)
+        if (resized := self._init_image) is None or resized.size != self.size:
+            resized = self._src_image.as_size(self.size, **self._resize_kwargs)
+        self._init_image = None
         width, height = size = resized.size
         # log.debug(f'Packing {resized=} into row with {width=}, {height=}')
         kwargs = {
@@ -9,7 +9,7 @@ from __future__ import annotations
 import tkinter.constants as tkc
 from tkinter import Frame
 from tkinter.ttk import Sizegrip
-from typing import TYPE_CHECKING, Union, Any
+from typing import TYPE_CHECKING, Union, Any, Iterable
 
 from tk_gui.caching import cached_property
 from .element import ElementBase
@@ -64,12 +64,17 @@ class InfoBar(RowFrame):
     May be included directly in a layout as a row (i.e., it does not need to be wrapped inside another row).
     """
     element_map: dict[str, Text]
+    _key_element_pairs: tuple[tuple[str, Text], ...]
+    _last_values: dict[str, str]
 
     def __init__(
         self, element_map: dict[str, Text], side: TkSide = 'b', fill: TkFill = 'both', pad: XY = (0, 0), **kwargs
     ):
         super().__init__(side=side, fill=fill, pad=pad, **kwargs)
         self.element_map = element_map
+        self._key_element_pairs = tuple(element_map.items())
+        # Values are tracked here to avoid redundant Tk calls when updating elements whose values did not change
+        self._last_values = {key: element.value for key, element in self._key_element_pairs}
 
     @classmethod
     def from_dict(cls, data: dict[str, str | tuple[str, XY]], text_pad_width: int = 2, **kwargs) -> InfoBar:
@@ -95,8 +100,25 @@ class InfoBar(RowFrame):
 
     def __setitem__(self, key: str, value: str):
         self.element_map[key].update(value)
+        self._last_values[key] = value
 
     def update(self, data: dict[str, str], auto_resize: Bool = False):
-        element_map = self.element_map
+        element_map, last_values = self.element_map, self._last_values
         for key, val in data.items():
-            element_map[key].update(val, auto_resize=auto_resize)
+            if last_values.get(key) != val:
+                element_map[key].update(val, auto_resize=auto_resize)
+                last_values[key] = val
+
+    def update_values(self, values: Iterable[str], auto_resize: Bool = False):
+        """
+        Update the displayed values positionally, without needing to look up each element by key.
+
+        :param values: The new values, in the same order as the keys in this info bar's :attr:`.element_map`.  Any
+          values beyond the number of elements in this info bar are ignored.
+        :param auto_resize: Whether each element should be resized to fit its new value
+        """
+        last_values = self._last_values
+        for (key, element), val in zip(self._key_element_pairs, values):
+            if last_values.get(key) != val:
+                element.update(val, auto_resize=auto_resize)
+                last_values[key] = val
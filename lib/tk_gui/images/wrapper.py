@@ -140,9 +140,9 @@ class ImageWrapper(Sized, ABC):
 
     @cached_property
     def raw_size(self) -> int:
+        # This is equivalent to `len(image.im)` after `image.load()`, but it does not require decoding the image
         image = self.pil_image
-        image.load()
-        return len(image.im)  # noqa  # This provides the raw / uncompressed size
+        return image.width * image.height
 
     def get_image_as_size(
         self,
@@ -234,6 +234,18 @@ class SourceImage(ImageWrapper):
         else:
             return sha256(self.to_bytes()).hexdigest()
 
+    def close_file(self):
+        """
+        Close the image file that was opened for this image (if it was initialized from a path or bytes), and discard
+        the PIL image and any decoded data.  Properties that only depend on the image's header are cached first.  The
+        image will be opened again if its data is needed later (e.g., to save it or to resize it at full resolution).
+        """
+        if isinstance(self._original, PILImage) or (image := self.__dict__.get('pil_image')) is None:
+            return
+        self.size, self.format, self.bits_per_pixel, self.raw_size  # noqa  # Populate the cached properties
+        image.close()
+        del self.__dict__['pil_image']
+
     def as_size(
         self,
         size: XY | None,
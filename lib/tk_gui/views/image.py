@@ -5,12 +5,17 @@ Tkinter GUI Image View
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor, Future
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Union, TypeVar, ParamSpec, Iterator
+from time import localtime, strftime
+from typing import TYPE_CHECKING, Union, Iterator
 
-from PIL.Image import registered_extensions
+from cachetools import LRUCache
+from PIL.Image import Resampling, registered_extensions, open as open_image
 
 from tk_gui.caching import cached_property
 from tk_gui.elements import InfoBar, ScrollableImage, Text, Frame, Button
@@ -33,8 +38,6 @@ if TYPE_CHECKING:
 __all__ = ['ImageView']
 log = logging.getLogger(__name__)
 
-P = ParamSpec('P')
-T = TypeVar('T')
 AnyImage = Union['ImageType', ImageWrapper]
 
 
@@ -42,9 +45,14 @@ AnyImage = Union['ImageType', ImageWrapper]
 
 
 class ImageDir:
-    # _SUFFIXES = {'.png', '.jpg', '.jpeg', '.bmp', '.webp', '.svg'}
-    _SUFFIXES = set(registered_extensions()) - {'.pdf'}
+    __slots__ = ('path', '_image_paths', '_sub_dirs', '_path_to_index', '_mtime_ns')
+    # _SUFFIXES = ('.png', '.jpg', '.jpeg', '.bmp', '.webp', '.svg')
+    _SUFFIXES = tuple(ext for ext in registered_extensions() if ext != '.pdf')
     path: Path
+    _image_paths: list[Path]
+    _sub_dirs: list[Path]
+    _path_to_index: dict[Path, int]
+    _mtime_ns: int
 
     def __new__(cls, image_dir: Path | ImageDir):
         if isinstance(image_dir, cls):
@@ -59,30 +67,84 @@ class ImageDir:
             raise TypeError(f'Invalid image dir={path.as_posix()!r} - not a directory')
         self.path = path
 
+    @classmethod
+    def get(cls, image_dir: Path | ImageDir) -> ImageDir:
+        """
+        Returns the recently used ImageDir for the given path, if one exists, to avoid re-scanning its contents.
+        Otherwise, a new ImageDir is initialized and stored for later use.  If the directory was modified since its
+        contents were scanned, then they will be re-scanned the next time they are accessed.
+        """
+        if isinstance(image_dir, cls):
+            img_dir = image_dir
+        else:
+            try:
+                img_dir = _recent_image_dirs[image_dir]
+            except KeyError:
+                _recent_image_dirs[image_dir] = img_dir = cls(image_dir)
+                return img_dir
+        img_dir.reset_if_modified()
+        return img_dir
+
+    def reset_if_modified(self):
+        """Discard the scanned contents of this directory if files were added / removed / renamed since the scan."""
+        try:
+            mtime_ns = self._mtime_ns
+        except AttributeError:  # It was not scanned yet
+            return
+        try:
+            modified = self.path.stat().st_mtime_ns != mtime_ns
+        except OSError:  # It is no longer accessible - keep the last known contents
+            return
+        if modified:
+            for attr in ('_mtime_ns', '_image_paths', '_sub_dirs', '_path_to_index'):
+                try:
+                    delattr(self, attr)
+                except AttributeError:
+                    pass
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}[images={len(self.image_paths)}]({self.path.as_posix()!r})>'
 
-    @cached_property(block=False)
-    def _split_contents(self) -> tuple[list[Path], list[Path]]:
+    def _split_contents(self):
+        # Symlinks are not followed, so links to images / directories are not included
         ok_suffixes = self._SUFFIXES
-        image_paths, sub_dirs = [], []
-        for p in self.path.iterdir():
-            if p.is_file():
-                if p.suffix.lower() in ok_suffixes:
-                    image_paths.append(p)
-            elif p.is_dir():
-                sub_dirs.append(p)
-        return image_paths, sub_dirs
+        named_image_paths, sub_dirs = [], []
+        # The mtime is read before scanning so that changes made during the scan will be detected later
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                # The cheap name check is done first so that is_file is only called for potential image files
+                if (name := entry.name.lower()).endswith(ok_suffixes) and entry.is_file(follow_symlinks=False):
+                    named_image_paths.append((name, Path(entry.path)))
+                elif entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(Path(entry.path))
+
+        named_image_paths.sort(key=itemgetter(0))  # The lower-case name is used as the sort key
+        self._image_paths, self._sub_dirs = [path for _, path in named_image_paths], sub_dirs
+        self._mtime_ns = mtime_ns
 
-    @cached_property(block=False)
+    @property
     def image_paths(self) -> list[Path]:
-        image_paths = self._split_contents[0]
-        image_paths.sort(key=lambda p: p.name.lower())
-        return image_paths
+        try:
+            return self._image_paths
+        except AttributeError:
+            pass
+        self._split_contents()
+        return self._image_paths
 
-    @cached_property(block=False)
+    @property
+    def scanned(self) -> bool:
+        """Whether the contents of this directory have been scanned yet"""
+        return hasattr(self, '_image_paths')
+
+    @property
     def sub_dirs(self) -> list[Path]:
-        return self._split_contents[1]
+        try:
+            return self._sub_dirs
+        except AttributeError:
+            pass
+        self._split_contents()
+        return self._sub_dirs
 
     # region Container Methods
 
@@ -114,15 +176,20 @@ class ImageDir:
 
     # region Index Methods
 
+    @property
+    def path_to_index(self) -> dict[Path, int]:
+        try:
+            return self._path_to_index
+        except AttributeError:
+            pass
+        self._path_to_index = path_to_index = {path: i for i, path in enumerate(self.image_paths)}
+        return path_to_index
+
     def index(self, path: Path) -> int:
-        return self.image_paths.index(path)
+        return self.path_to_index[path]
 
     def get_relative_index(self, path: Path, delta: int = 1) -> OptInt:
-        if not delta:
-            return None
-        try:
-            current_index = self.index(path)
-        except IndexError:
+        if not delta or (current_index := self.path_to_index.get(path)) is None:
             return None
 
         dst_index = current_index + delta
@@ -137,6 +204,9 @@ class ImageDir:
     # endregion
 
 
+_recent_image_dirs: LRUCache[Path, ImageDir] = LRUCache(8)
+
+
 class EmptyImageDirError(Exception):
     def __init__(self, path: Path):
         self.path = path
@@ -156,7 +226,7 @@ class DirPicker(View, is_popup=True):
         kwargs.setdefault('margins', (0, 0))
         kwargs.setdefault('exit_on_esc', True)
         super().__init__(title=title or 'Browse Subfolders', **kwargs)
-        self.image_dir: ImageDir = image_dir
+        self.image_dir: ImageDir = ImageDir.get(image_dir)
         self.last_dir: ImageDir | None = last_dir
         self.init_dir = image_dir if init_dir is None else init_dir
 
@@ -171,12 +241,11 @@ class DirPicker(View, is_popup=True):
         yield [Text('<-', size=(12, 1)), Text('= previous folder level (..)')]
 
     def _dirs(self) -> Iterator[str, int | str]:
-        for path in sorted(self.image_dir.path.iterdir()):
-            if path.is_dir():
-                try:
-                    yield path.name, len(ImageDir(path))
-                except PermissionError:
-                    pass
+        for path in sorted(self.image_dir.sub_dirs):
+            try:
+                yield path.name, len(ImageDir(path))
+            except PermissionError:
+                pass
 
     @cached_property(block=False)
     def table(self) -> Table:
@@ -243,7 +312,7 @@ class DirPicker(View, is_popup=True):
             if not self.image_dir and self.image_dir != self.init_dir:
                 raise EmptyImageDirError(next_path)
             return next_path
-        elif (img_dir := ImageDir(next_path)) or img_dir.sub_dirs or chdir:
+        elif (img_dir := ImageDir.get(next_path)) or img_dir.sub_dirs or chdir:
             # log.debug(f'Moving into {img_dir=}' if chdir else f'Returning {img_dir=}')
             return self._change_dir(img_dir) if chdir else img_dir
         else:
@@ -252,7 +321,7 @@ class DirPicker(View, is_popup=True):
     def _change_dir(self, img_dir: Path | ImageDir) -> Path | None:  # noqa
         self.window.hide()
         # TODO: Update table in-place instead
-        return DirPicker(ImageDir(img_dir), last_dir=self.image_dir, init_dir=self.init_dir).run()  # noqa
+        return DirPicker(ImageDir.get(img_dir), last_dir=self.image_dir, init_dir=self.init_dir).run()  # noqa
 
     @event_handler('<space>', '<Right>', '<Left>', '<Double-Button-1>')
     def handle_chdir_key(self, event: Event):
@@ -282,70 +351,241 @@ class MenuBar(Menu):
 
 
 class ActiveImage:
+    __slots__ = (
+        'src_image', 'image', 'image_dir', '_resized', '_max_work_size', '_work_image',
+        '_file_name', '_title_prefix', '_file_info', '_dir_index', '_static_info',
+    )
     src_image: SourceImage
-    image_dir: ImageDir | None = None
+    image: ResizedImage
+    _resized: LRUCache[XY, ResizedImage]
+    _max_work_size: XY | None
+    _work_image: ResizedImage | None
+    image_dir: ImageDir | None
+    _file_name: str
+    _title_prefix: str
+    _file_info: tuple[str, str, str]
+    _info_bar_keys = ('size', 'dir_pos', 'size_pct', 'size_bytes', 'mod_time', 'directory')
+    # Max total pixels in recently used resized copies (enough for a few window-sized copies / zoom levels)
+    _max_cached_pixels: int = 2 * 3840 * 2160
+    _dir_index: OptInt
+    _static_info: tuple[str, str, str]
 
-    def __init__(self, image: AnyImage, new_size: XY = None, image_dir: ImageDir = None, standalone: bool = False):
+    def __init__(
+        self,
+        image: AnyImage,
+        new_size: XY = None,
+        image_dir: ImageDir = None,
+        standalone: bool = False,
+        resize_mode: ImgResizeMode = ImageResizeMode.NONE,
+        max_work_size: XY = None,
+        work_image: ResizedImage = None,
+    ):
+        """
+        :param image: The image to display
+        :param new_size: The initial size for the image
+        :param image_dir: The directory containing the image, if known
+        :param standalone: True to skip directory handling
+        :param resize_mode: How the ``new_size`` should be applied
+        :param max_work_size: The max size for a reduced copy of the image that will be used as the source when
+          resizing it to sizes that are smaller than that copy (typically slightly larger than the monitor size)
+        :param work_image: A reduced copy of the image that was already prepared based on ``max_work_size``
+        """
         self.src_image = SourceImage.from_image(image)
-        self.image = image = self.src_image.as_size(new_size)
+        # Recently used sizes are kept so that zooming back to them does not require resizing the source image again.
+        # The cache is limited by pixel count rather than item count, since zoomed-in copies may be very large.
+        self._resized = LRUCache(self._max_cached_pixels, getsizeof=_pixel_count)
+        self._max_work_size = max_work_size
+        if work_image is not None:
+            self._work_image = work_image
+        image = self.resize(new_size, resize_mode)
         log.debug(f'Initialized ActiveImage with {image=}')
-        if not standalone:
-            self.image_dir = ImageDir(self.src_image.path.parent) if image_dir is None else image_dir
+        if standalone:
+            self.image_dir = None
+        else:
+            self.image_dir = ImageDir.get(self.src_image.path.parent if image_dir is None else image_dir)
 
-    @cached_property(block=False)
+    @property
     def path(self) -> Path:
         return self.src_image.path
 
-    @cached_property(block=False)
+    @property
     def file_name(self) -> str:
-        if path := self.src_image.path:
-            return path.name
-        return ''
+        try:
+            return self._file_name
+        except AttributeError:
+            pass
+        self._file_name = file_name = path.name if (path := self.src_image.path) else ''
+        return file_name
+
+    @property
+    def title_prefix(self) -> str:
+        try:
+            return self._title_prefix
+        except AttributeError:
+            pass
+        self._title_prefix = prefix = f'{file_name} \u2014 ' if (file_name := self.file_name) else ''
+        return prefix
 
     def title_parts(self, show_dir: bool = False) -> tuple[str, str]:
-        prefix = f'{self.file_name} \u2014 ' if self.file_name else ''
+        prefix = self.title_prefix
         suffix = '' if self.image.size_percent == 1 else f' (Zoom: {self.image.size_str})'
-        if show_dir and (img_dir := self.image_dir):
+        if show_dir and (img_dir := self.image_dir) is not None:
             suffix += f' (Folder: {img_dir.path.as_posix()})'
         return prefix, suffix
 
-    @cached_property(block=False)
-    def _file_info(self) -> tuple[str, str, str]:
+    @property
+    def file_info(self) -> tuple[str, str, str]:
+        try:
+            return self._file_info
+        except AttributeError:
+            pass
         try:
             stat_results = self.src_image.path.stat()
         except AttributeError:
             size_b, mod_time = 0, ''
         else:
             size_b = stat_results.st_size
-            mod_time = datetime.fromtimestamp(stat_results.st_mtime).isoformat(' ', 'seconds')
-        return mod_time, readable_bytes(size_b), readable_bytes(self.src_image.raw_size)
+            mod_time = strftime('%Y-%m-%d %H:%M:%S', localtime(stat_results.st_mtime))
+        self._file_info = file_info = (mod_time, _readable_bytes(size_b), _readable_bytes(self.src_image.raw_size))
+        return file_info
 
-    @cached_property(block=False)
-    def dir_index(self) -> int:
-        return self.image_dir.index(self.path) + 1
-
-    def get_info_bar_data(self, show_dir: bool = True) -> dict[str, str]:
-        image, src_image, img_dir = self.image, self.src_image, self.image_dir
-        mod_time, file_b, raw_b = self._file_info
-        data = {
-            'size': f'{src_image.size_str} x {src_image.bits_per_pixel} BPP',
-            'dir_pos': f'{self.dir_index}/{len(img_dir)}' if img_dir else '1/1',
-            'size_pct': f'{image.size_percent:.0%}',
-            'size_bytes': f'{file_b} / {raw_b}',
-            'mod_time': mod_time,
-        }
-        if show_dir and img_dir:
-            data['directory'] = img_dir.path.as_posix()
-        return data
+    @property
+    def dir_index(self) -> OptInt:
+        """The 1-based position of this image in its directory, or None if it is not in that directory's image list"""
+        try:
+            return self._dir_index
+        except AttributeError:
+            pass
+        # Symlinks are excluded from directory scans, so a linked image may not be present in its directory's list
+        if (dir_index := self.image_dir.path_to_index.get(self.path)) is not None:
+            dir_index += 1
+        self._dir_index = dir_index
+        return dir_index
+
+    def get_info_bar_data(self, show_dir: bool = True, scan_dir: bool = True) -> dict[str, str]:
+        return dict(zip(self._info_bar_keys, self.get_info_bar_values(show_dir, scan_dir)))
+
+    def get_info_bar_values(self, show_dir: bool = True, scan_dir: bool = True) -> tuple[str, ...]:
+        """
+        :param show_dir: Whether the directory containing this image should be included
+        :param scan_dir: Whether the directory containing this image should be scanned (if it was not already) to
+          determine this image's position in it.  If False and it was not already scanned, a placeholder is used.
+        :return: The info bar values, in the same order as the keys in the dict returned by :meth:`.get_info_bar_data`
+        """
+        img_dir = self.image_dir
+        if img_dir is not None and not scan_dir and not img_dir.scanned:
+            dir_pos = '?/?'
+        else:
+            dir_pos = f'{self.dir_index or "?"}/{len(img_dir)}' if img_dir else '1/1'
+
+        size_str, size_bytes, mod_time = self._static_info_bar_values
+        values = (size_str, dir_pos, f'{self.image.size_percent:.0%}', size_bytes, mod_time)
+        if show_dir and img_dir is not None:
+            return (*values, img_dir.path.as_posix())
+        return values
+
+    @property
+    def _static_info_bar_values(self) -> tuple[str, str, str]:
+        """The info bar values that do not change when this image is resized"""
+        try:
+            return self._static_info
+        except AttributeError:
+            pass
+        src_image = self.src_image
+        mod_time, file_b, raw_b = self.file_info
+        size_str = f'{src_image.size_str} x {src_image.bits_per_pixel} BPP'
+        self._static_info = static_info = (size_str, f'{file_b} / {raw_b}', mod_time)
+        return static_info
 
     def resize(self, size: XY | None, resize_mode: ImgResizeMode = ImageResizeMode.NONE) -> ResizedImage:
-        self.image = image = self.src_image.as_size(size, resize_mode=resize_mode)
+        src_image = self.src_image
+        target_size = src_image.target_size(size, resize_mode=resize_mode) if size else src_image.size
+        try:
+            image = self._resized[target_size]
+        except KeyError:
+            image = self._resize(size, target_size, resize_mode)
+            try:
+                self._resized[target_size] = image
+            except ValueError:  # It is larger than the entire cache, so it is not cached
+                pass
+        self.image = image
         return image
 
+    def _resize(self, size: XY | None, target_size: XY, resize_mode: ImgResizeMode) -> ResizedImage:
+        work_image = self.work_image
+        if work_image is None or target_size[0] > work_image.width or target_size[1] > work_image.height:
+            return self.src_image.as_size(size, resize_mode=resize_mode)
+        # The target size was already calculated based on the source image, so keep_ratio is not needed here
+        image = work_image.get_image_as_size(target_size, keep_ratio=False, resample=Resampling.LANCZOS)
+        return ResizedImage(self.src_image, image)
+
+    @property
+    def work_image(self) -> ResizedImage | None:
+        """
+        A reduced copy of the source image, if the source image is larger than the max work size.  Resizing this copy
+        instead of a much larger source image is significantly faster.
+        """
+        try:
+            return self._work_image
+        except AttributeError:
+            pass
+        self._work_image = work_image = _get_work_image(self.src_image, self._max_work_size)
+        return work_image
+
     def scale_percent(self, percent: float) -> ResizedImage:
         return self.resize(self.image.scale_percent(percent))
 
 
+def _get_work_image(src_image: SourceImage, max_size: XY | None) -> ResizedImage | None:
+    if not max_size or (work_size := src_image.fit_inside_size(max_size)) == src_image.size:
+        return None
+    work_image = _load_draft_image(src_image, work_size) or src_image.as_size(work_size)
+    # The work image is used in place of the source image from now on, so the source file and data can be released
+    src_image.close_file()
+    return work_image
+
+
+def _load_draft_image(src_image: SourceImage, size: XY) -> ResizedImage | None:
+    """
+    If the given source image is a JPEG that has not been decoded yet, then a separate copy of it is decoded at the
+    smallest reduced scale that is still at least as large as the given size, and resized to that size.  The source
+    image is not modified, so it can still be decoded at full resolution later if necessary.
+
+    :param src_image: The source image
+    :param size: The target size, which must fit inside the source image's size
+    :return: A ResizedImage with the given size, or None if the source image did not support this
+    """
+    pil_image = src_image.pil_image
+    if pil_image.format != 'JPEG' or not pil_image.tile or (path := src_image.path) is None:
+        return None
+    with open_image(path) as draft_image:  # The reduced copy is decoded from a separate file handle, closed here
+        draft_image.draft(pil_image.mode, size)  # Uses the JPEG decoder's DCT scaling to decode at 1/2, 1/4, or 1/8
+        return ResizedImage(src_image, draft_image.resize(size, resample=Resampling.LANCZOS))
+
+
+def _prepare_image(path: Path, max_work_size: XY | None) -> tuple[SourceImage, ResizedImage | None]:
+    """
+    Prepare the image at the given path so that it can be displayed without decoding it in the main thread.  If the
+    image is larger than the max work size, then only its reduced working copy is decoded (at a reduced scale, when
+    supported), and the source file is closed so that neither the file nor the full resolution image is held while the
+    result waits to be used.  Otherwise, the full image is decoded, which also closes the file.
+    """
+    src_image = SourceImage(path)
+    if (work_image := _get_work_image(src_image, max_work_size)) is None:
+        src_image.pil_image.load()
+    return src_image, work_image
+
+
+def _pixel_count(image: ResizedImage) -> int:
+    return image.width * image.height
+
+
+@lru_cache(256)
+def _readable_bytes(size: int) -> str:
+    # Uncompressed sizes repeat for every image with the same dimensions and mode
+    return readable_bytes(size)
+
+
 # endregion
 
 
@@ -355,6 +595,8 @@ class ImageView(View):
     active_image: ActiveImage
     dir_loc: InfoLoc
     standalone: bool = False
+    _prefetched: dict[Path, Future[tuple[SourceImage, ResizedImage | None]]]
+    _update_details_id: str | None = None
 
     def __init__(
         self,
@@ -375,10 +617,11 @@ class ImageView(View):
         self._save_as_init_dir = save_as_init_dir
         self.dir_loc = InfoLoc(dir_loc)
         self.standalone = standalone
-        self.active_image = ActiveImage(SourceImage.from_image(image), standalone=standalone)
+        self.active_image = ActiveImage(image, standalone=standalone, max_work_size=self._max_work_size)
         self.window_kwargs['show'] = 2
         if size := self._new_window_size():
             self.window_kwargs['size'] = size
+        self._prefetched = {}
 
     def _show_dir(self, location: InfoLoc) -> bool:
         return self.dir_loc == location and not self.standalone
@@ -390,14 +633,27 @@ class ImageView(View):
             return None
 
         img_box = self.active_image.src_image.box.with_size_offset(60)
-        if monitor := self.get_monitor():
-            work_area = monitor.work_area.with_size_offset(-60)
+        if (work_area := self._monitor_work_area) is not None:
+            work_area = work_area.with_size_offset(-60)
             if not img_box.fits_inside(work_area):
                 return img_box.fit_inside_size(work_area.size)
 
         return img_box.size
 
-    @cached_property
+    @cached_property(block=False)
+    def _monitor_work_area(self) -> Box | None:
+        if monitor := self.get_monitor():
+            return monitor.work_area
+        return None
+
+    @cached_property(block=False)
+    def _max_work_size(self) -> XY | None:
+        if (work_area := self._monitor_work_area) is not None:
+            width, height = work_area.size
+            return int(width * 1.5), int(height * 1.5)
+        return None
+
+    @cached_property(block=False)
     def _height_offset(self) -> int:
         style = self.window.style
         # footer_req_height = self.info_bar.widget.winfo_reqheight()  # Usually 22
@@ -410,7 +666,7 @@ class ImageView(View):
         # log.debug(f'{footer_req_height=}, {scroll_x_height=}')
         return footer_req_height + scroll_x_height
 
-    @cached_property
+    @cached_property(block=False)
     def _width_offset(self) -> int:
         style = self.window.style
         # scroll_y_width = self.gui_image.widget.scroll_bar_y.winfo_reqwidth()  # usually 12->15 / 14->17
@@ -419,10 +675,13 @@ class ImageView(View):
         scroll_y_width = scroll_width + (2 * scroll.get('bd', 1)) + 1
         return scroll_y_width
 
+    @cached_property(block=False)
+    def _window_box_offset(self) -> XY:
+        return -self._width_offset, -self._height_offset
+
     @property
     def _window_box(self) -> Box:
-        win_box = Box.from_pos_and_size(0, 0, *self.window.true_size)
-        return win_box.with_size_offset((-self._width_offset, -self._height_offset))
+        return Box.from_pos_and_size(0, 0, *self.window.true_size).with_size_offset(self._window_box_offset)
 
     # endregion
 
@@ -466,11 +725,14 @@ class ImageView(View):
         yield [self.gui_image]
         yield self.info_bar
 
-    @cached_property
+    @cached_property(block=False)
     def info_bar(self) -> InfoBar:
-        return InfoBar.from_dict(self.active_image.get_info_bar_data(self._show_dir(InfoLoc.FOOTER)))
+        # The directory is not scanned yet so that the window can be displayed sooner.  The image's position in the
+        # directory will be populated when the info bar is updated after the window is displayed.
+        info_bar_data = self.active_image.get_info_bar_data(self._show_dir(InfoLoc.FOOTER), scan_dir=False)
+        return InfoBar.from_dict(info_bar_data)
 
-    @cached_property
+    @cached_property(block=False)
     def gui_image(self) -> ScrollableImage:
         kwargs = {'pad': (0, 0), 'style': self._style}
         if self._add_save_as_menu:
@@ -479,31 +741,81 @@ class ImageView(View):
 
             kwargs['right_click_menu'] = ImageMenu()
 
-        # return ScrollableImage(None, size=self._window_box.size, anchor='c', **kwargs)
-        return ScrollableImage(None, size=self._window_box.size, expand=True, fill='both', **kwargs)
+        image = self.active_image.resize(self._window_box.size, ImageResizeMode.FIT_INSIDE)
+        # return ScrollableImage(image, size=image.size, anchor='c', **kwargs)
+        return ScrollableImage(image, size=image.size, expand=True, fill='both', **kwargs)
 
     def finalize_window(self) -> Window:
         window = super().finalize_window()
         window.update()
-        # By waiting until after the window has been shown before rendering the image, it avoids some initial jitter
-        # while tk Configure events are triggered due to the window being rendered.
-        self._update(self.active_image.resize(self._window_box.size, ImageResizeMode.FIT_INSIDE), True)
+        # The image was already resized to fit the initial window when it was added to the layout, so it only needs to
+        # be rendered again if the window's size changed while tk Configure events were triggered by showing it.
+        active_image, box_size = self.active_image, self._window_box.size
+        if active_image.src_image.fit_inside_size(box_size) != active_image.image.size:
+            self._update(active_image.resize(box_size, ImageResizeMode.FIT_INSIDE), True)
+        else:
+            self._update_details(True)
+        self._prefetch_adjacent_images()
         return window
 
+    def cleanup(self):
+        self._cancel_update_details()
+        if (executor := self.__dict__.get('_prefetch_executor')) is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     # endregion
 
     # region Image Methods
 
     def update_active_image(self, image: AnyImage, image_dir: ImageDir = None):
-        src_image = SourceImage.from_image(image)
-        self.active_image = ActiveImage(src_image, src_image.fit_inside_size(self._window_box.size), image_dir)
+        work_image = None
+        if isinstance(image, Path) and (future := self._prefetched.pop(image, None)) is not None:
+            image, work_image = future.result()
+        self.active_image = ActiveImage(
+            image,
+            self._window_box.size,
+            image_dir,
+            resize_mode=ImageResizeMode.FIT_INSIDE,
+            max_work_size=self._max_work_size,
+            work_image=work_image,
+        )
         self._update(self.active_image.image)
+        self._prefetch_adjacent_images()
+
+    @cached_property(block=False)
+    def _prefetch_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{self.__class__.__name__}-prefetch')
+
+    def _prefetch_adjacent_images(self):
+        """
+        Load the previous and next images in the active directory in a background thread, so they are ready by the time
+        an arrow key is pressed to navigate to them.
+        """
+        active_image, prefetched = self.active_image, self._prefetched
+        adjacent = []
+        if (image_dir := active_image.image_dir) is not None:
+            for delta in (1, -1):
+                if (index := image_dir.get_relative_index(active_image.path, delta)) is not None:
+                    adjacent.append(image_dir[index])
+
+        # Images that are no longer adjacent are discarded so that their decoded data does not stay in memory
+        for path in [path for path in prefetched if path not in adjacent]:
+            prefetched.pop(path).cancel()
+
+        max_work_size = self._max_work_size
+        for path in adjacent:
+            if path not in prefetched:
+                prefetched[path] = self._prefetch_executor.submit(_prepare_image, path, max_work_size)
 
     def resize_image(self, size: XY | None, resize_mode: ImgResizeMode = ImageResizeMode.NONE):
-        self._update(self.active_image.resize(size, resize_mode))
+        active_image = self.active_image
+        last_image = active_image.image
+        # The current image is returned when the size did not change, in which case nothing needs to be re-rendered
+        if (image := active_image.resize(size, resize_mode)) is not last_image:
+            self._update(image)
 
     def update_image_dir(self, img_dir: Path | ImageDir):
-        new_img_dir = img_dir if isinstance(img_dir, ImageDir) else ImageDir(img_dir)
+        new_img_dir = ImageDir.get(img_dir)
         try:
             img_path = new_img_dir[0]
         except IndexError:
@@ -513,24 +825,45 @@ class ImageView(View):
             self.update_active_image(img_path, new_img_dir)
 
     def cycle_around(self):
-        if (image_dir := self.active_image.image_dir) is None:
+        if not (image_dir := self.active_image.image_dir):  # No directory, or it contains no (non-symlink) images
             return
         last_index = len(image_dir) - 1
-        img_index = image_dir.index(self.active_image.path)
+        # If the active image is not in the directory's image list (i.e., it is a symlink), then start from the first
+        img_index = image_dir.path_to_index.get(self.active_image.path)
         index = last_index if img_index == 0 else 0
         self.update_active_image(image_dir[index], image_dir)
 
     # endregion
 
     def _update(self, image: ResizedImage, frame: bool = False):
+        self._update_image(image)
+        self._update_details(frame)
+
+    def _update_image(self, image: ResizedImage):
         self.gui_image.update(image, image.size)
+
+    def _update_details(self, frame: bool = False):
+        self._cancel_update_details()
         self.window.set_title(self.title)
-        info_bar_data = self.active_image.get_info_bar_data(self._show_dir(InfoLoc.FOOTER))
-        self.info_bar.update(info_bar_data, auto_resize=True)
+        info_bar_values = self.active_image.get_info_bar_values(self._show_dir(InfoLoc.FOOTER))
+        self.info_bar.update_values(info_bar_values, auto_resize=True)
         if frame:
             # TODO: Why is this still needed with expand=True, fill=both?
             self._update_frame_size(self.window.true_size)
 
+    def _schedule_update_details(self, delay_ms: int = 100):
+        """
+        Update the title and info bar after the given delay, unless another update is scheduled before then.  Used to
+        avoid updating them for every intermediate step in a burst of zoom events, when only the last one is relevant.
+        """
+        self._cancel_update_details()
+        self._update_details_id = self.window.root.after(delay_ms, self._update_details)
+
+    def _cancel_update_details(self):
+        if update_id := self._update_details_id:
+            self._update_details_id = None
+            self.window.root.after_cancel(update_id)
+
     def _update_frame_size(self, size: XY):
         win_w, win_h = size
         self._last_size = size
@@ -567,7 +900,11 @@ class ImageView(View):
             self._zoom_image(1.1)
 
     def _zoom_image(self, percent: float):
-        self._update(self.active_image.scale_percent(percent))
+        active_image = self.active_image
+        last_image = active_image.image
+        if (image := active_image.scale_percent(percent)) is not last_image:  # It may round to the same size
+            self._update_image(image)
+            self._schedule_update_details()
         # TODO: Add way to grab image to drag the current view around
 
     @event_handler('<Home>', '<End>', '<Prior>', '<Next>')
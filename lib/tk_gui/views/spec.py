@@ -4,6 +4,7 @@ ViewSpec contains the class and arguments necessary to initialize a View.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from inspect import Signature
 from typing import TYPE_CHECKING, TypeVar, ParamSpec, Callable, Iterator, Generic
 
@@ -18,11 +19,10 @@ ViewType = Callable[P, V]
 
 
 class ViewSpec(Generic[V, P]):
-    __slots__ = ('view_cls', 'args', 'kwargs', '_sig')
+    __slots__ = ('view_cls', 'args', 'kwargs')
     view_cls: ViewType
     args: P.args
     kwargs: P.kwargs
-    _sig: Signature
 
     def __init__(self, view_cls: ViewType, args: P.args, kwargs: P.kwargs):
         self.view_cls = view_cls
@@ -30,9 +30,7 @@ class ViewSpec(Generic[V, P]):
         self.kwargs = kwargs
 
     def __iter__(self) -> Iterator[ViewType | P.args | P.kwargs]:
-        yield self.view_cls
-        yield self.args
-        yield self.kwargs
+        return iter((self.view_cls, self.args, self.kwargs))
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}({self.view_cls.__name__}, {self.args!r}, {self.kwargs!r})>'
@@ -54,12 +52,7 @@ class ViewSpec(Generic[V, P]):
 
     @property
     def signature(self) -> Signature:
-        try:
-            return self._sig
-        except AttributeError:
-            pass
-        self._sig = sig = Signature.from_callable(self.view_cls)
-        return sig
+        return _get_signature(self.view_cls)
 
     @property
     def name(self) -> str:
@@ -74,3 +67,9 @@ class ViewSpec(Generic[V, P]):
         bound = self.signature.bind_partial(*self.args)
         self.args = ()
         self.kwargs = bound.arguments | self.kwargs | kwargs
+
+
+@lru_cache(50)
+def _get_signature(view_cls: ViewType) -> Signature:
+    # The signature only depends on the View class, so it is shared by all specs for that class
+    return Signature.from_callable(view_cls)
@@ -20,7 +20,7 @@ class Direction(IntEnum):
 
     def __invert__(self) -> Direction:
         """``~Direction.REVERSE`` -> ``Direction.FORWARD``, and vice versa."""
-        return self.REVERSE if self == self.FORWARD else self.FORWARD
+        return self.REVERSE if self else self.FORWARD  # FORWARD is the only truthy member
 
     @classmethod
     def _missing_(cls, value):
@@ -30,32 +30,28 @@ class Direction(IntEnum):
 
 
 class History:
-    __slots__ = ('_data',)
-    _data: tuple[deque[ViewSpec], deque[ViewSpec]]
+    __slots__ = ('reverse', 'forward', '_data')
+    reverse: deque[ViewSpec]
+    forward: deque[ViewSpec]
+    _data: tuple[deque[ViewSpec], deque[ViewSpec]]  # Indexed by Direction
 
     def __init__(self, max_len: int = None):
-        self._data = (deque(maxlen=max_len), deque(maxlen=max_len))
+        self.reverse = deque(maxlen=max_len)
+        self.forward = deque(maxlen=max_len)
+        self._data = (self.reverse, self.forward)
 
     def __repr__(self) -> str:
         reverse, forward = map(len, self._data)
         return f'<{self.__class__.__name__}[{reverse=}, {forward}]>'
 
-    @property
-    def reverse(self) -> deque[ViewSpec]:
-        return self._data[0]
-
-    @property
-    def forward(self) -> deque[ViewSpec]:
-        return self._data[1]
-
     def __getitem__(self, direction: Direction | int) -> deque[ViewSpec]:
         return self._data[direction]
 
     def clear(self, reverse: bool = True, forward: bool = True):
         if reverse:
-            self._data[Direction.REVERSE].clear()
+            self.reverse.clear()
         if forward:
-            self._data[Direction.FORWARD].clear()
+            self.forward.clear()
 
     def append(self, spec: ViewSpec, direction: Direction | int):
         self._data[direction].append(spec)
@@ -125,10 +121,9 @@ class GuiState:
         self._enqueued.append(QueuedViewSpec(spec, forget_last))
 
     def enqueue_hist_view(self, direction: Direction | int, forget_last: bool = False, **kwargs) -> bool:
-        try:
-            spec = self._history[direction][-1]
-        except IndexError:
+        if not (specs := self._history[direction]):
             return False
+        spec = specs[-1]
         if kwargs:
             spec.update(**kwargs)
         self._enqueued.append(QueuedViewSpec(spec, forget_last, from_hist=True, hist_dir=~Direction(direction)))
@@ -145,24 +140,18 @@ class GuiState:
     # region Peek / Introspection
 
     def peek_next_view(self) -> ViewSpec | None:
-        try:
-            return self._enqueued[0].spec
-        except IndexError:
-            return None
+        return enqueued[0].spec if (enqueued := self._enqueued) else None
 
     def peek_hist_view(self, direction: Direction | int) -> ViewSpec | None:
-        try:
-            return self._history[direction][-1]
-        except IndexError:
-            return None
+        return specs[-1] if (specs := self._history[direction]) else None
 
     @property
     def can_go_reverse(self) -> bool:
-        return bool(self._history[Direction.REVERSE])
+        return bool(self._history.reverse)
 
     @property
     def can_go_forward(self) -> bool:
-        return bool(self._history[Direction.FORWARD])
+        return bool(self._history.forward)
 
     @property
     def prev_view_name(self) -> str | None:
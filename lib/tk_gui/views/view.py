@@ -32,8 +32,7 @@ class View(WindowInitializer, ABC):
     def __init__(self, *args, gui_state: GuiState = None, **kwargs):
         self.gui_state = gui_state or GuiState.init(ViewSpec(self.__class__, args, kwargs.copy()))
         if default_kwargs := self.default_window_kwargs:
-            for key, value in default_kwargs.items():
-                kwargs.setdefault(key, value)
+            kwargs = default_kwargs | kwargs
         super().__init__(*args, **kwargs)
 
     # region Next View Methods
@@ -76,9 +75,12 @@ class View(WindowInitializer, ABC):
         with :meth:`.go_to_next_view`.
         """
         try:
-            view_cls, args, kwargs = self.get_next_view_spec()
-        except (TypeError, NoNextView):
+            spec = self.get_next_view_spec()
+        except NoNextView:
             return None
+        if spec is None:  # May be returned by subclasses that override get_next_view_spec
+            return None
+        view_cls, args, kwargs = spec
         if 'gui_state' in kwargs:  # Not using setdefault to avoid mutating the stored kwargs
             return view_cls(*args, **kwargs)
         else:
@@ -10,7 +10,6 @@ import logging
 from typing import TYPE_CHECKING, Any, TypeVar, Generic
 
 from tk_gui.enums import ScrollUnit
-from tk_gui.utils import extract_kwargs
 from .utils import get_root_widget
 
 if TYPE_CHECKING:
@@ -46,11 +45,16 @@ def _axis_config_key_map(axis: Axis):
 
 
 class AxisConfig(Generic[ScrollAmount]):
-    __slots__ = ('axis', 'what', 'amount', 'scroll', 'fill', '_size_div')
+    __slots__ = ('axis', 'what', 'amount', 'scroll', 'fill', '_size_div', '_view_scroll_args')
     # _default_divs = {'x': 1, 'y': 1.5}
     _default_divs = {'x': 1, 'y': 2}
     _key_maps = {'x': _axis_config_key_map('x'), 'y': _axis_config_key_map('y')}
     _keys = {axis: frozenset(key_map) for axis, key_map in _key_maps.items()}
+    _arg_names = ('scroll', 'amount', 'what', 'fill', 'size_div')
+    _axis_arg_names = {
+        'x': tuple(f'{name}_x' for name in _arg_names),
+        'y': tuple(f'{name}_y' for name in _arg_names),
+    }
 
     def __init__(
         self,
@@ -62,44 +66,41 @@ class AxisConfig(Generic[ScrollAmount]):
         size_div: float = None,
     ):
         self.axis = axis
-        self.what = what = ScrollUnit(what)
+        # The default (and most common) case is already a member, so the Enum value lookup can be skipped
+        self.what = what = what if type(what) is ScrollUnit else ScrollUnit(what)
         if amount is None:
             amount = _DEFAULT_SCROLL_PIXELS
-        if not isinstance(amount, int) and what != ScrollUnit.PIXELS:
+        if not isinstance(amount, int) and what is not ScrollUnit.PIXELS:
             raise TypeError(f'Invalid type={amount.__class__.__name__} for {amount=} with {what=}')
         self.scroll = scroll
         self.amount = amount
         self.fill = fill
         self._size_div = size_div
+        # when `what` is `units`, 1 unit = the scroll increment, which defaults to 1/10th of the window's width/height
+        # when `what` is `pages`, 1 page = 9/10ths of the window's width/height
+        tk_what = 'units' if what is ScrollUnit.PIXELS else what.value
+        # Indexed by the `positive` bool passed to view_scroll_args, which is called for every scroll event
+        self._view_scroll_args = ((-amount, tk_what), (amount, tk_what))
 
     @classmethod
     def from_kwargs(cls, axis: Axis, kwargs: dict[str, Any]) -> AxisConfig:
-        if extracted := extract_kwargs(kwargs, cls._keys[axis]):
-            key_map = cls._key_maps[axis]
-            return cls(axis, **{key_map[key]: val for key, val in extracted.items()})
-        return cls(axis)
+        if (keys := cls._keys[axis]).isdisjoint(kwargs):  # The common case - avoids creating an empty intersection
+            return cls(axis)
+        # The matching keys are popped directly into their mapped names, without an intermediate dict
+        key_map, pop = cls._key_maps[axis], kwargs.pop
+        return cls(axis, **{key_map[key]: pop(key) for key in keys.intersection(kwargs)})
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}({self.arg_str()})>'
 
     def view_scroll_args(self, positive: bool) -> tuple[ScrollAmount, TkScrollWhat]:
-        amount = self.amount if positive else -self.amount
-        # when `what` is `units`, 1 unit = the scroll increment, which defaults to 1/10th of the window's width/height
-        # when `what` is `pages`, 1 page = 9/10ths of the window's width/height
-        what = 'units' if self.what == ScrollUnit.PIXELS else self.what.value
-        # log.debug(f'Scrolling along axis={self.axis} {amount=} self.what={self.what.value} ({what=})')
-        return amount, what
+        # log.debug(f'Scrolling along axis={self.axis} {positive=} self.what={self.what.value}')
+        return self._view_scroll_args[positive]
 
     def arg_str(self, include_axis: Bool = False) -> str:
-        format_key = f'{{}}_{self.axis}'.format if include_axis else str
-        data = {
-            'scroll': self.scroll,
-            'amount': self.amount,
-            'what': self.what.value,
-            'fill': self.fill,
-            'size_div': self.size_div,
-        }
-        return ', '.join(f'{format_key(k)}={v!r}' for k, v in data.items())
+        names = self._axis_arg_names[self.axis] if include_axis else self._arg_names
+        values = (self.scroll, self.amount, self.what.value, self.fill, self.size_div)
+        return ', '.join(f'{name}={val!r}' for name, val in zip(names, values))
 
     @property
     def size_div(self) -> float | int:
@@ -128,6 +129,11 @@ class FillConfig:
     _default_percents = {'x': 1, 'y': 0.8}
     _key_maps = {'x': _fill_config_key_map('x'), 'y': _fill_config_key_map('y')}
     _keys = {axis: frozenset(key_map) for axis, key_map in _key_maps.items()}
+    _arg_names = ('fill', 'fill_pct')
+    _axis_arg_names = {
+        'x': tuple(f'{name}_x' for name in _arg_names),
+        'y': tuple(f'{name}_y' for name in _arg_names),
+    }
 
     def __init__(self, axis: Axis, fill: bool = False, fill_pct: float = None):
         self.axis = axis
@@ -138,18 +144,18 @@ class FillConfig:
 
     @classmethod
     def from_kwargs(cls, axis: Axis, kwargs: dict[str, Any]) -> FillConfig:
-        if extracted := extract_kwargs(kwargs, cls._keys[axis]):
-            key_map = cls._key_maps[axis]
-            return cls(axis, **{key_map[key]: val for key, val in extracted.items()})
-        return cls(axis)
+        if (keys := cls._keys[axis]).isdisjoint(kwargs):  # The common case - avoids creating an empty intersection
+            return cls(axis)
+        # The matching keys are popped directly into their mapped names, without an intermediate dict
+        key_map, pop = cls._key_maps[axis], kwargs.pop
+        return cls(axis, **{key_map[key]: pop(key) for key in keys.intersection(kwargs)})
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}({self.arg_str()})>'
 
     def arg_str(self, include_axis: Bool = False) -> str:
-        format_key = f'{{}}_{self.axis}'.format if include_axis else str
-        data = {'fill': self.fill, 'fill_pct': self.fill_pct}
-        return ', '.join(f'{format_key(k)}={v!r}' for k, v in data.items())
+        names = self._axis_arg_names[self.axis] if include_axis else self._arg_names
+        return ', '.join(f'{name}={val!r}' for name, val in zip(names, (self.fill, self.fill_pct)))
 
     @property
     def fill_pct(self) -> float:
@@ -5,23 +5,23 @@ Tkinter GUI Scrollable Images
 from __future__ import annotations
 
 import logging
-from tkinter import BaseWidget, Frame, Image as TkBaseImage
+from tkinter import BaseWidget, Frame, Event
 from typing import TYPE_CHECKING, Union, Optional, Any, Iterator
 
-from PIL.ImageTk import PhotoImage
-
 from tk_gui.geometry import Box
 from .scroll import ComplexScrollable
 from .utils import get_size_and_pos
 
 if TYPE_CHECKING:
+    from tkinter import Image as TkBaseImage
+    from PIL.ImageTk import PhotoImage
     from tk_gui.styles import Style
     from tk_gui.typing import XY
 
 __all__ = ['ScrollableImage']
 log = logging.getLogger(__name__)
 
-TkImage = Union[TkBaseImage, PhotoImage]
+TkImage = Union['TkBaseImage', 'PhotoImage']
 
 
 class ScrollableImage(ComplexScrollable, Frame):
@@ -29,6 +29,8 @@ class ScrollableImage(ComplexScrollable, Frame):
     inner_widget: TkImage
     _inner_id: int | None = None
     _last_img_box = Box(0, 0, 0, 0)
+    _canvas_box: Box | None = None
+    _scroll_region_dirty: bool = True
 
     # region Initialization
 
@@ -46,6 +48,7 @@ class ScrollableImage(ComplexScrollable, Frame):
     ):
         self.__size = size = (width, height)
         super().__init__(parent, width=width, height=height, padx=padx, pady=pady, verify=verify, **kwargs)
+        self.canvas.bind('<Configure>', self._handle_canvas_configure, add=True)
         self.set_image(image, size)
         self.__initializing = False
 
@@ -69,18 +72,22 @@ class ScrollableImage(ComplexScrollable, Frame):
         if self.__initializing:
             return Box.from_pos_and_size(0, 0, *size)
 
-        canvas_box = Box.from_size_and_pos(*get_size_and_pos(self.canvas))
+        # The canvas geometry is only re-read after it changes, rather than for every image change / region update
+        if (canvas_box := self._canvas_box) is None:
+            self._canvas_box = canvas_box = Box.from_size_and_pos(*get_size_and_pos(self.canvas))
         # log.debug(f'Centering image within {canvas_box=}')
         return canvas_box.center(size)
 
+    def _handle_canvas_configure(self, event: Event = None):
+        self._canvas_box = None
+        self._scroll_region_dirty = True
+
     def set_image(self, image: TkImage, size: XY):
         self.inner_widget = image
-        try:
-            del self.__dict__['widgets']  # Clear the cached property
-        except KeyError:
-            pass
+        self.__dict__.pop('widgets', None)  # Clear the cached property
 
         self._last_img_box = img_box = self._center_image_box(size)
+        self._scroll_region_dirty = True
         x, y = img_box.min_xy
         # Note: Using anchor=center was not working as intended.  Using anchor=nw + a calculated position seems to
         # produce more consistent results.
@@ -92,6 +99,7 @@ class ScrollableImage(ComplexScrollable, Frame):
             # log.debug(f'Deleting image={inner_id!r}')
             self.canvas.delete(inner_id)
             self._inner_id = None
+            self._scroll_region_dirty = True
 
     def replace_image(self, image: TkImage, size: XY):
         self.del_image()
@@ -99,14 +107,20 @@ class ScrollableImage(ComplexScrollable, Frame):
         self.update_scroll_region()
 
     def update_scroll_region(self, force: bool = False, **kwargs):
+        if not (force or kwargs or self._scroll_region_dirty):
+            return  # Neither the canvas items nor the canvas geometry changed since the image was last centered
         super().update_scroll_region(force, **kwargs)
-        img_box = self._center_image_box(self._last_img_box.size)
-        # if force or self._last_img_box != img_box:
-        if self._last_img_box != img_box:
+        last_box = self._last_img_box
+        img_box = self._center_image_box(last_box.size)
+        # if force or last_box != img_box:
+        if last_box != img_box:
             self._last_img_box = img_box
             # log.debug(f'[{force=}] Moving image={self._inner_id!r} to center={img_box}')
             # log.debug(f'Moving image={self._inner_id!r} to center={img_box}')
             self.canvas.moveto(self._inner_id, *img_box.min_xy)
+            # Moving the image changes the canvas bbox, so the scroll region should be refreshed on the next update
+        else:
+            self._scroll_region_dirty = False
 
     def resize(self, width: int = None, height: int = None, force: bool = False):
         size = (width, height)
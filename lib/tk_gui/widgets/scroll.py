@@ -7,7 +7,6 @@ Tkinter GUI Scroll Bar Utils
 from __future__ import annotations
 
 import logging
-import re
 import tkinter.constants as tkc
 from abc import ABC, abstractmethod
 from tkinter import BaseWidget, Frame, LabelFrame, Canvas, Widget, Event, Toplevel, Text, Listbox, TclError
@@ -40,7 +39,6 @@ AXIS_DIR_SIDE_ANCHOR = {'x': (tkc.HORIZONTAL, tkc.BOTTOM, tkc.S), 'y': (tkc.VERT
 
 class ScrollableBase(BaseWidget, ABC):
     """Base class for scrollable widgets and containers."""
-    _tk_w_cls_search = re.compile(r'^(.*?)\d*$').search
     _scrollable_container_cls_names = set()
 
     _w: str  # Inherited from BaseWidget
@@ -58,7 +56,7 @@ class ScrollableBase(BaseWidget, ABC):
         id_parts = self._w.split('.!')[:-1]
         for i, id_part in enumerate(id_parts[::-1]):
             # Note: The below may break if a class extending ScrollableContainer has a numeric suffix in its name
-            if (m := self._tk_w_cls_search(id_part)) and m.group(1) in self._scrollable_container_cls_names:
+            if id_part.rstrip('0123456789') in self._scrollable_container_cls_names:
                 return self.nametowidget('.!'.join(id_parts[:-i]))
         return None
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main, skipUnless
+from unittest.mock import patch
+
+from PIL.Image import new as new_image
+
+from tk_gui.views.image import ActiveImage, _prepare_image
+
+PROC_FDS = Path('/proc/self/fd')
+
+
+def open_fd_count(path: Path) -> int:
+    count = 0
+    for fd_path in PROC_FDS.iterdir():
+        try:
+            if os.path.realpath(fd_path) == str(path):
+                count += 1
+        except OSError:  # The fd used to list the directory was already closed
+            pass
+    return count
+
+
+class ImageTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name).resolve()
+
+    def make_image(self, name: str, size: tuple[int, int] = (4000, 3000)) -> Path:
+        path = self.tmp_dir.joinpath(name)
+        new_image('RGB', size, 'red').save(path)
+        return path
+
+
+@skipUnless(PROC_FDS.is_dir(), 'Requires /proc/self/fd')
+class ActiveImageFileHandleTest(ImageTestCase):
+    def assert_no_open_fds(self, path: Path):
+        image = ActiveImage(path, (800, 600), resize_mode='fit', max_work_size=(1920, 1080))
+        self.assertEqual((800, 600), image.image.size)
+        self.assertEqual(0, open_fd_count(path))
+        image.get_info_bar_values()  # Header-based values should not re-open the file
+        self.assertEqual(0, open_fd_count(path))
+
+    def test_jpeg_draft_work_image_closes_source(self):
+        self.assert_no_open_fds(self.make_image('test.jpg'))
+
+    def test_png_work_image_closes_source(self):
+        self.assert_no_open_fds(self.make_image('test.png'))
+
+    def test_zoom_past_work_image_closes_source(self):
+        path = self.make_image('test.jpg')
+        image = ActiveImage(path, (800, 600), resize_mode='fit', max_work_size=(1920, 1080))
+        self.assertEqual((8000, 6000), image.resize((8000, 6000)).size)
+        self.assertEqual(0, open_fd_count(path))
+
+
+@skipUnless(PROC_FDS.is_dir(), 'Requires /proc/self/fd')
+class PrepareImageFileHandleTest(ImageTestCase):
+    def test_prepare_large_jpeg_closes_source(self):
+        path = self.make_image('test.jpg')
+        src_image, work_image = _prepare_image(path, (1920, 1080))
+        self.assertEqual((1440, 1080), work_image.size)
+        self.assertEqual((4000, 3000), src_image.size)
+        self.assertEqual(0, open_fd_count(path))
+
+    def test_prepare_small_image_closes_source(self):
+        path = self.make_image('test.png', (400, 300))
+        src_image, work_image = _prepare_image(path, (1920, 1080))
+        self.assertIsNone(work_image)
+        self.assertEqual((400, 300), src_image.size)
+        self.assertEqual(0, open_fd_count(path))
+
+
+
+class ActiveImageResizeCacheTest(ImageTestCase):
+    def test_zoom_back_and_forth_reuses_cached_image(self):
+        image = ActiveImage(self.make_image('test.png', (1600, 1200)))
+        small = image.resize((800, 600))
+        large = image.resize((1200, 900))
+        self.assertIsNot(small, large)
+        self.assertIs(small, image.resize((800, 600)))
+        self.assertIs(large, image.resize((1200, 900)))
+
+    def test_oversize_images_are_not_cached(self):
+        with patch.object(ActiveImage, '_max_cached_pixels', 1_000_000):
+            image = ActiveImage(self.make_image('test.png', (1600, 1200)))
+            small = image.resize((800, 600))
+            full = image.resize((3200, 2400))  # 7.68M px > 1M px
+            self.assertEqual((3200, 2400), full.size)
+            self.assertIsNot(full, image.resize((3200, 2400)))
+            self.assertIs(small, image.resize((800, 600)))  # Other entries were not evicted
+
+    def test_least_recently_used_images_are_evicted(self):
+        with patch.object(ActiveImage, '_max_cached_pixels', 1_000_000):
+            image = ActiveImage(self.make_image('test.png', (1600, 1200)))
+            first = image.resize((800, 600))  # 480K px
+            second = image.resize((640, 480))  # 307K px
+            self.assertIs(first, image.resize((800, 600)))
+            image.resize((600, 450))  # 270K px - the total would exceed 1M px, so the second image is evicted
+            self.assertIs(first, image.resize((800, 600)))
+            self.assertIsNot(second, image.resize((640, 480)))
+
+
+if __name__ == '__main__':
+    main(exit=False, verbosity=2)